@@ -1,12 +1,19 @@
 import cProfile
 import csv
 import datetime
-import io
+import gzip
 import json
 import logging
+import mmap
 import os
 import pstats
+import re
+import sys
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice, zip_longest
 from multiprocessing import Pool, cpu_count
 from pathlib import Path
 
@@ -17,6 +24,11 @@ from rich.table import Table
 from rich.theme import Theme
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Define icons
 ICON_CHECK = "[OK]"
 ICON_CREATE = "[CREATE]"
@@ -25,6 +37,33 @@ ICON_SUCCESS = "[SUCCESS]"
 ICON_TIME = "[TIME]"
 ICON_SPEED = "[SPEED]"
 
+# Saída JSON indentada apenas para depuração (DLLOGS_PRETTY=1)
+PRETTY = bool(os.environ.get("DLLOGS_PRETTY"))
+
+# Grava um objeto JSON por linha (.jsonl) em vez de um array (DLLOGS_NDJSON=1)
+NDJSON = bool(os.environ.get("DLLOGS_NDJSON"))
+OUTPUT_SUFFIX = ".jsonl" if NDJSON else ".json"
+
+# Comprime a saída com gzip nível 1 (DLLOGS_GZIP=1): troca E/S de disco por
+# pouca CPU e grava arquivos .json.gz/.jsonl.gz
+GZIP = bool(os.environ.get("DLLOGS_GZIP"))
+if GZIP:
+    OUTPUT_SUFFIX += ".gz"
+
+# Executa o teste de verificação sob cProfile (DLLOGS_PROFILE=1)
+PROFILE = bool(os.environ.get("DLLOGS_PROFILE"))
+
+# Arquivo, no diretório de saída, com a assinatura da última verificação
+# aprovada; enquanto nada mudar, o teste de verificação não é repetido
+_VERIFY_CACHE_NAME = ".verify_cache.json"
+
+# Tamanho do buffer de escrita dos arquivos de saída
+_BUFFER_SIZE = 1 << 20
+
+# Registros por bloco de leitura/escrita e blocos pendentes na thread de I/O
+_WRITE_BATCH = 1024
+_MAX_PENDING_WRITES = 4
+
 # Pré-computa o mapeamento de flags para parse_unit_flag
 _UNIT_FLAG_MAP = {
     0x00000001: "AFFILIATION_MINE",
@@ -65,6 +104,240 @@ _SCHOOL_FLAG_MAP = {
 }
 
 
+def _build_flag_tables(flag_map, nbytes):
+    """
+    Precompute, for each byte of a flag, the names set by every byte value.
+
+    Every key of the flag maps fits inside a single byte, so the names of a
+    flag are the concatenation of the per-byte entries, in map order.
+
+    Args:
+        flag_map (dict): Mapping of flag bits (or masks) to names.
+        nbytes (int): Number of bytes covered by the flag.
+
+    Returns:
+        tuple: One 256-entry tuple of name tuples per byte.
+    """
+    tables = []
+    for shift in range(0, nbytes * 8, 8):
+        keys = [(k, name) for k, name in flag_map.items() if k >> shift & 0xFF]
+        tables.append(
+            tuple(
+                tuple(name for k, name in keys if (byte << shift) & k)
+                for byte in range(256)
+            )
+        )
+    return tuple(tables)
+
+
+# Nomes de cada byte das flags, indexados pelo valor do byte
+_UNIT_FLAG_TABLES = _build_flag_tables(_UNIT_FLAG_MAP, 4)
+_SCHOOL_FLAG_TABLE = _build_flag_tables(_SCHOOL_FLAG_MAP, 1)[0]
+
+# Nomes dos tipos de poder usados por resolv_power_type
+_POWER_TYPE_MAP = {
+    -2: "health",
+    0: "mana",
+    1: "rage",
+    2: "focus",
+    3: "energy",
+    4: "combo points",
+    5: "runes",
+    6: "runic power",
+    7: "soul shards",
+    8: "lunar power",
+    9: "holy power",
+    10: "alternate",
+    11: "maelstrom",
+    12: "chi",
+    13: "insanity",
+    14: "obsolete",
+    15: "obsolete2",
+    16: "arcane charges",
+    17: "fury",
+    18: "pain",
+    19: "essence",
+    20: "rune blood",
+    21: "rune frost",
+    22: "rune unholy",
+    23: "alternate quest",
+    24: "alternate encounter",
+    25: "alternate mount",
+    26: "num power types",
+}
+
+# Especializações de cada classe, indexadas pelo ID usado no COMBATANT_INFO
+_CLASS_SPECS = [
+    {
+        "Class": "Death Knight",
+        "Specs": {
+            250: "Blood",
+            251: "Frost",
+            252: "Unholy",
+            1455: "Initial",
+        },
+    },
+    {
+        "Class": "Demon Hunter",
+        "Specs": {
+            577: "Havoc",
+            581: "Vengeance",
+            1456: "Initial",
+        },
+    },
+    {
+        "Class": "Druid",
+        "Specs": {
+            102: "Balance",
+            103: "Feral",
+            104: "Guardian",
+            105: "Restoration",
+            1447: "Initial",
+        },
+    },
+    {
+        "Class": "Evoker",
+        "Specs": {
+            1467: "Devastation",
+            1468: "Preservation",
+            1473: "Augmentation",
+            1465: "Initial",
+        },
+    },
+    {
+        "Class": "Hunter",
+        "Specs": {
+            253: "Beast Mastery",
+            254: "Marksmanship",
+            255: "Survival",
+            1448: "Initial",
+        },
+    },
+    {
+        "Class": "Mage",
+        "Specs": {
+            62: "Arcane",
+            63: "Fire",
+            64: "Frost",
+            1449: "Initial",
+        },
+    },
+    {
+        "Class": "Monk",
+        "Specs": {
+            268: "Brewmaster",
+            270: "Mistweaver",
+            269: "Windwalker",
+            1450: "Initial",
+        },
+    },
+    {
+        "Class": "Paladin",
+        "Specs": {
+            65: "Holy",
+            66: "Protection",
+            70: "Retribution",
+            1451: "Initial",
+        },
+    },
+    {
+        "Class": "Priest",
+        "Specs": {
+            256: "Discipline",
+            257: "Holy",
+            258: "Shadow",
+            1452: "Initial",
+        },
+    },
+    {
+        "Class": "Rogue",
+        "Specs": {
+            259: "Assassination",
+            260: "Outlaw",
+            261: "Subtlety",
+            1453: "Initial",
+        },
+    },
+    {
+        "Class": "Shaman",
+        "Specs": {
+            262: "Elemental",
+            263: "Enhancement",
+            264: "Restoration",
+            1444: "Initial",
+        },
+    },
+    {
+        "Class": "Warlock",
+        "Specs": {
+            265: "Affliction",
+            266: "Demonology",
+            267: "Destruction",
+            1454: "Initial",
+        },
+    },
+    {
+        "Class": "Warrior",
+        "Specs": {
+            71: "Arms",
+            72: "Fury",
+            73: "Protection",
+            1446: "Initial",
+        },
+    },
+]
+
+# ID da especialização -> (classe, especialização), para extract_spec_info
+_SPEC_TABLE = {
+    spec_id: (class_data["Class"], spec)
+    for class_data in _CLASS_SPECS
+    for spec_id, spec in class_data["Specs"].items()
+}
+
+# Tabela para remover parênteses com str.translate
+_PARENS = str.maketrans("", "", "()")
+
+# Localiza apenas os caracteres estruturais dos itens equipados
+_PAREN_REGEX = re.compile(r"[()]")
+
+# Delimitadores dos grupos do COMBATANT_INFO (talentos, itens, auras)
+_BRACKET_REGEX = re.compile(r"[\[\]()]")
+_OPEN_BRACKETS = frozenset("[(")
+
+# Cache de conversões int() para IDs que se repetem (talentos, bônus, gemas)
+_INT_CACHE = {}
+_INT_CACHE_MAX = 1 << 16
+
+# Limite de entradas do cache de timestamps de cada Parser
+_TIMESTAMP_CACHE_MAX = 100_000
+
+# Tipo de partida com espaços, reescrito com "_" antes do split do CSV
+_MATCH_TYPE = "Rated Solo Shuffle"
+
+
+def _unit_flag_names(f):
+    """Return the names set in an integer unit flag, in _UNIT_FLAG_MAP order."""
+    t0, t1, t2, t3 = _UNIT_FLAG_TABLES
+    return (
+        *t0[f & 0xFF],
+        *t1[f >> 8 & 0xFF],
+        *t2[f >> 16 & 0xFF],
+        *t3[f >> 24 & 0xFF],
+    )
+
+
+# Os logs usam poucas combinações de flags; o cache limitado evita repetir
+# int(..., 0) sem crescer sem limite em logs com flags arbitrárias
+@lru_cache(maxsize=1024)
+def _unit_flag_names_str(flag):
+    return _unit_flag_names(int(flag, 0))
+
+
+@lru_cache(maxsize=256)
+def _school_flag_names_str(school):
+    return _SCHOOL_FLAG_TABLE[int(school, 0) & 0xFF]
+
+
 def parse_unit_flag(flag):
     """
     Parse unit flags used in the game.
@@ -75,8 +348,9 @@ def parse_unit_flag(flag):
     Returns:
         list: A list of flag descriptions.
     """
-    f = int(flag, 0) if isinstance(flag, str) else flag
-    return [_UNIT_FLAG_MAP.get(k) for k in _UNIT_FLAG_MAP if f & k]
+    if isinstance(flag, str):
+        return list(_unit_flag_names_str(flag))
+    return list(_unit_flag_names(flag))
 
 
 def parse_school_flag(school):
@@ -89,8 +363,9 @@ def parse_school_flag(school):
     Returns:
         list: A list of school names.
     """
-    s = int(school, 0) if isinstance(school, str) else school
-    return [_SCHOOL_FLAG_MAP.get(k) for k in _SCHOOL_FLAG_MAP if s & k]
+    if isinstance(school, str):
+        return list(_school_flag_names_str(school))
+    return list(_SCHOOL_FLAG_TABLE[school & 0xFF])
 
 
 def resolv_power_type(pt):
@@ -103,388 +378,513 @@ def resolv_power_type(pt):
     Returns:
         str: The corresponding power type name.
     """
-    pt_map = {
-        -2: "health",
-        0: "mana",
-        1: "rage",
-        2: "focus",
-        3: "energy",
-        4: "combo points",
-        5: "runes",
-        6: "runic power",
-        7: "soul shards",
-        8: "lunar power",
-        9: "holy power",
-        10: "alternate",
-        11: "maelstrom",
-        12: "chi",
-        13: "insanity",
-        14: "obsolete",
-        15: "obsolete2",
-        16: "arcane charges",
-        17: "fury",
-        18: "pain",
-        19: "essence",
-        20: "rune blood",
-        21: "rune frost",
-        22: "rune unholy",
-        23: "alternate quest",
-        24: "alternate encounter",
-        25: "alternate mount",
-        26: "num power types",
-    }
-    return pt_map.get(pt)
+    return _POWER_TYPE_MAP.get(pt)
 
 
-class SpellParser:
-    def parse(self, cols):
-        return (
-            {
-                "spellId": cols[0],
-                "spellName": cols[1],
-                "spellSchool": parse_school_flag(cols[2]),
-            },
-            cols[3:],
-        )
+@lru_cache(maxsize=64)
+def _spec_info(spec_id):
+    """
+    Describe a specialization ID as its class and spec names.
 
+    The same few IDs repeat for every combatant of a match, so the result
+    dict is cached and shared between records; callers must not mutate it.
 
-class EnvParser:
-    def parse(self, cols):
-        return ({"environmentalType": cols[0]}, cols[1:])
+    Args:
+        spec_id (int): The specialization ID.
 
+    Returns:
+        dict: The ID with its class and spec names ("Unknown" if not found).
+    """
+    player_class, spec = _SPEC_TABLE.get(spec_id, ("Unknown", "Unknown"))
+    return {"id": spec_id, "class": player_class, "spec": spec}
 
-class SwingParser:
-    def parse(self, cols):
-        return ({}, cols)
 
+def _split_csv(csv_text):
+    """
+    Split the CSV part of a combat log line into columns.
 
-class WorldPrefixParser:
-    def parse(self, cols):
-        return ({}, cols[1:])
+    The C ``csv`` parser is fed the line directly, without wrapping it in a
+    ``StringIO`` first; quoted fields come back unquoted. Lines without any
+    quote (COMBATANT_INFO, ARENA_MATCH_*) are split with ``str.split``,
+    which gives the same columns; their bracketed groups are reassembled
+    later by ``process_cols``.
 
+    Args:
+        csv_text (str): The comma-separated part of the line.
 
-class WorldMarkerParser:
-    def parse(self, cols):
-        return {
-            "mapId": int(cols[1]),
-            "markerId": int(cols[2]),
-            "x": float(cols[3]),
-            "y": float(cols[4]),
-        }
+    Returns:
+        list: The columns of the event.
+    """
+    if csv_text and '"' not in csv_text:
+        return csv_text.split(",")
+    return next(csv.reader((csv_text,)))
 
 
-class DamageParser:
-    def parse(self, cols):
-        cols = cols[8:]
-        try:
-            return {
-                "amount": int(cols[0]) if cols[0] != "nil" else 0,
-                "overkill": cols[1],
-                "school": parse_school_flag(cols[2]),
-                "resisted": float(cols[3]),
-                "blocked": float(cols[4]),
-                "absorbed": float(cols[5]),
-                "critical": cols[6] != "nil",
-                "glancing": cols[7] != "nil",
-                "crushing": cols[8] != "nil",
-            }
-        except ValueError as e:
-            logging.error(f"Error parsing ENVIRONMENTAL_DAMAGE: {e}")
-            return {}
+def _iter_lines(buf):
+    """
+    Iterate over the lines of a memory-mapped log file.
 
+    Newlines are located with the C-level ``find`` of the mapping, and only
+    the slice of each line is copied and decoded. Only LF and CRLF line
+    endings are supported: unlike text mode, a lone CR does not end a line.
 
-class MissParser:
-    def parse(self, cols):
-        obj = {"missType": cols[0]}
-        if len(cols) > 1:
-            obj["isOffHand"] = cols[1]
-        if len(cols) > 2:
-            obj["amountMissed"] = int(cols[2])
-        return obj
+    Args:
+        buf (mmap.mmap): The mapped file contents.
 
+    Yields:
+        str: Each decoded line, ending with a single newline.
+    """
+    find = buf.find
+    size = len(buf)
+    start = 0
+    while start < size:
+        end = find(b"\n", start) + 1 or size
+        # Converte finais "\r\n" em "\n"; um "\r" isolado não separa linhas
+        yield buf[start:end].rstrip(b"\r\n").decode("utf-8") + "\n"
+        start = end
 
-class HealParser:
-    def parse(self, cols):
-        cols = cols[8:]
-        return {
-            "amount": int(cols[0]),
-            "overhealing": int(cols[1]),
-            "absorbed": int(cols[2]),
-            "critical": cols[3] != "nil",
-        }
 
+def _cached_int(s):
+    """
+    Convert a numeric string to int, reusing previously converted values.
 
-class HealAbsorbedParser:
-    def parse(self, cols):
-        return {
-            "casterGUID": cols[0],
-            "casterName": cols[1],
-            "casterFlags": parse_unit_flag(cols[2]),
-            "casterRaidFlags": parse_unit_flag(cols[3]),
-            "absorbSpellId": cols[4],
-            "absorbSpellName": cols[5],
-            "absorbSpellSchool": parse_school_flag(cols[6]),
-            "amount": int(cols[7]),
-            "totalAmount": int(cols[8]),
-            "critical": cols[8] != "nil",
-        }
+    Args:
+        s (str): The numeric string.
 
+    Returns:
+        int: The converted integer.
+    """
+    v = _INT_CACHE.get(s)
+    if v is None:
+        if len(_INT_CACHE) >= _INT_CACHE_MAX:
+            _INT_CACHE.clear()
+        v = _INT_CACHE[s] = int(s)
+    return v
 
-class EnergizeParser:
-    def parse(self, cols):
-        cols = cols[8:]
-        return {
-            "amount": int(cols[0]),
-            "powerType": resolv_power_type(cols[1]),
-        }
 
+def _to_ints(s):
+    """
+    Convert a comma-separated string of integers into a list.
 
-class DrainParser:
-    def parse(self, cols):
-        amount = int(cols[11])
-        powerType = resolv_power_type(cols[12])
-        maxPower = float(cols[13])
-        extraAmount = int(cols[14])
-        return {
-            "amount": amount,
-            "powerType": powerType,
-            "maxPower": maxPower,
-            "extraAmount": extraAmount,
-        }
+    Args:
+        s (str): The string, possibly wrapped in parentheses.
 
+    Returns:
+        list: A list of integers, empty if the string holds no values.
+        Empty tokens, such as the one left by a trailing comma, are skipped.
+    """
+    return [_cached_int(x) for x in s.translate(_PARENS).split(",") if x]
 
-class LeechParser:
-    def parse(self, cols):
-        return {
-            "amount": int(cols[0]),
-            "powerType": resolv_power_type(cols[1]),
-            "extraAmount": int(cols[2]),
-        }
 
+def parse_spell(cols, start=0):
+    return (
+        {
+            "spellId": cols[start],
+            "spellName": sys.intern(cols[start + 1]),
+            "spellSchool": parse_school_flag(cols[start + 2]),
+        },
+        start + 3,
+    )
 
-class SpellBlockParser:
-    def parse(self, cols):
-        obj = {
-            "extraSpellID": cols[0],
-            "extraSpellName": cols[1],
-            "extraSchool": parse_school_flag(cols[2]),
-        }
-        if len(cols) == 4:
-            obj["auraType"] = cols[3]
-        return obj
 
+def parse_env(cols, start=0):
+    return ({"environmentalType": cols[start]}, start + 1)
 
-class ExtraAttackParser:
-    def parse(self, cols):
-        return {"amount": int(cols[0])}
 
+def parse_swing(cols, start=0):
+    return ({}, start)
 
-class AuraParser:
-    def parse(self, cols):
-        obj = {"auraType": cols[0]}
-        if len(cols) >= 2:
-            obj["amount"] = int(cols[1])
-        if len(cols) >= 3:
-            obj["auraExtra1"] = cols[2]
-        if len(cols) >= 4:
-            obj["auraExtra2"] = cols[3]
-        return obj
 
+def parse_world_prefix(cols, start=0):
+    return ({}, start + 1)
 
-class AuraDoseParser:
-    def parse(self, cols):
-        obj = {"auraType": cols[0]}
-        if len(cols) == 2:
-            obj["powerType"] = resolv_power_type(cols[1])
-        return obj
+
+def parse_world_marker(cols, start=0):
+    return {
+        "mapId": int(cols[start + 1]),
+        "markerId": int(cols[start + 2]),
+        "x": float(cols[start + 3]),
+        "y": float(cols[start + 4]),
+    }
 
 
-class AuraBrokenParser:
-    def parse(self, cols):
+def parse_damage(cols, start=0):
+    start += 8
+    try:
         return {
-            "extraSpellID": cols[0],
-            "extraSpellName": cols[1],
-            "extraSchool": parse_school_flag(cols[2]),
-            "auraType": cols[3],
+            "amount": int(cols[start]) if cols[start] != "nil" else 0,
+            "overkill": cols[start + 1],
+            "school": parse_school_flag(cols[start + 2]),
+            "resisted": float(cols[start + 3]),
+            "blocked": float(cols[start + 4]),
+            "absorbed": float(cols[start + 5]),
+            "critical": cols[start + 6] != "nil",
+            "glancing": cols[start + 7] != "nil",
+            "crushing": cols[start + 8] != "nil",
         }
+    except ValueError as e:
+        logging.error(f"Error parsing ENVIRONMENTAL_DAMAGE: {e}")
+        return {}
 
 
-class CastFailedParser:
-    def parse(self, cols):
-        return {"failedType": cols[0]}
+def parse_miss(cols, start=0):
+    obj = {"missType": sys.intern(cols[start])}
+    if len(cols) - start > 1:
+        obj["isOffHand"] = cols[start + 1]
+    if len(cols) - start > 2:
+        obj["amountMissed"] = int(cols[start + 2])
+    return obj
 
 
-class EnchantParser:
-    def parse(self, cols):
-        return (
-            {
-                "spellName": cols[0],
-                "itemID": cols[1],
-                "itemName": cols[2],
-            },
-            cols,
-        )
+def parse_heal(cols, start=0):
+    start += 8
+    return {
+        "amount": int(cols[start]),
+        "overhealing": int(cols[start + 1]),
+        "absorbed": int(cols[start + 2]),
+        "critical": cols[start + 3] != "nil",
+    }
 
 
-class EncountParser:
-    def parse(self, cols):
-        obj = {
-            "encounterID": cols[0],
-            "encounterName": cols[1],
-            "difficultyID": cols[2],
-            "groupSize": cols[3],
-            "fightTime": cols[5],
-        }
-        if len(cols) == 5:
-            obj["success"] = cols[4] == "1"
-        return obj
+def parse_heal_absorbed(cols, start=0):
+    return {
+        "casterGUID": cols[start],
+        "casterName": cols[start + 1],
+        "casterFlags": parse_unit_flag(cols[start + 2]),
+        "casterRaidFlags": parse_unit_flag(cols[start + 3]),
+        "absorbSpellId": cols[start + 4],
+        "absorbSpellName": cols[start + 5],
+        "absorbSpellSchool": parse_school_flag(cols[start + 6]),
+        "amount": int(cols[start + 7]),
+        "totalAmount": int(cols[start + 8]),
+        "critical": cols[start + 8] != "nil",
+    }
 
 
-class VoidParser:
-    def parse(self, cols):
-        return ({}, cols)
+def parse_energize(cols, start=0):
+    start += 8
+    return {
+        "amount": int(cols[start]),
+        "powerType": resolv_power_type(cols[start + 1]),
+    }
 
 
-class ArenaMatchStartParser:
-    def parse(self, cols):
-        """
-        Processa os dados do evento ARENA_MATCH_START.
+def parse_drain(cols, start=0):
+    amount = int(cols[start + 11])
+    powerType = resolv_power_type(cols[start + 12])
+    maxPower = float(cols[start + 13])
+    extraAmount = int(cols[start + 14])
+    return {
+        "amount": amount,
+        "powerType": powerType,
+        "maxPower": maxPower,
+        "extraAmount": extraAmount,
+    }
 
-        Args:
-            cols: Lista de colunas do evento
 
-        Returns:
-            dict: Dicionário com os dados processados
-        """
-        try:
-            return {
-                "instance_id": int(cols[0]),  # Convertendo para int e usando snake_case
-                "match_type": cols[2],  # Pulando cols[1] que é 'unk'
-                "team_id": int(cols[3]),  # Convertendo para int e usando snake_case
-            }
-        except (IndexError, ValueError) as e:
-            return {
-                "event": "ARENA_MATCH_START",
-                "error": f"Erro ao processar linha: {str(e)}",
-                "raw_data": cols,
-            }
+def parse_leech(cols, start=0):
+    return {
+        "amount": int(cols[start]),
+        "powerType": resolv_power_type(cols[start + 1]),
+        "extraAmount": int(cols[start + 2]),
+    }
+
+
+def parse_spell_block(cols, start=0):
+    obj = {
+        "extraSpellID": cols[start],
+        "extraSpellName": cols[start + 1],
+        "extraSchool": parse_school_flag(cols[start + 2]),
+    }
+    if len(cols) - start == 4:
+        obj["auraType"] = cols[start + 3]
+    return obj
+
+
+def parse_extra_attack(cols, start=0):
+    return {"amount": int(cols[start])}
+
+
+def parse_aura(cols, start=0):
+    obj = {"auraType": cols[start]}
+    if len(cols) - start >= 2:
+        obj["amount"] = int(cols[start + 1])
+    if len(cols) - start >= 3:
+        obj["auraExtra1"] = cols[start + 2]
+    if len(cols) - start >= 4:
+        obj["auraExtra2"] = cols[start + 3]
+    return obj
+
 
+def parse_aura_dose(cols, start=0):
+    obj = {"auraType": cols[start]}
+    if len(cols) - start == 2:
+        obj["powerType"] = resolv_power_type(cols[start + 1])
+    return obj
 
-class ArenaMatchEndParser:
-    def parse(self, cols):
+
+def parse_aura_broken(cols, start=0):
+    return {
+        "extraSpellID": cols[start],
+        "extraSpellName": cols[start + 1],
+        "extraSchool": parse_school_flag(cols[start + 2]),
+        "auraType": cols[start + 3],
+    }
+
+
+def parse_cast_failed(cols, start=0):
+    return {"failedType": cols[start]}
+
+
+def parse_enchant(cols, start=0):
+    return (
+        {
+            "spellName": cols[start],
+            "itemID": cols[start + 1],
+            "itemName": cols[start + 2],
+        },
+        start,
+    )
+
+
+def parse_encounter(cols, start=0):
+    obj = {
+        "encounterID": cols[start],
+        "encounterName": cols[start + 1],
+        "difficultyID": cols[start + 2],
+        "groupSize": cols[start + 3],
+        "fightTime": cols[start + 5],
+    }
+    if len(cols) - start == 5:
+        obj["success"] = cols[start + 4] == "1"
+    return obj
+
+
+def parse_void(cols, start=0):
+    return ({}, start)
+
+
+def parse_arena_match_start(cols, start=0):
+    """
+    Processa os dados do evento ARENA_MATCH_START.
+
+    Args:
+        cols: Lista de colunas do evento
+        start: Índice da primeira coluna do evento em cols
+
+    Returns:
+        dict: Dicionário com os dados processados
+    """
+    try:
         return {
-            "winningTeam": cols[0],
-            "matchDuration": cols[1],
-            "newRatingTeam1": cols[2],
-            "newRatingTeam2": cols[3],
+            "instance_id": int(cols[start]),  # Convertendo para int e usando snake_case
+            "match_type": cols[start + 2],  # Pulando cols[1] que é 'unk'
+            "team_id": int(cols[start + 3]),  # Convertendo para int e usando snake_case
+        }
+    except (IndexError, ValueError) as e:
+        return {
+            "event": "ARENA_MATCH_START",
+            "error": f"Erro ao processar linha: {str(e)}",
+            "raw_data": cols[start:],
         }
 
 
-class VoidSuffixParser:
-    def parse(self, cols):
-        return {}
+def parse_arena_match_end(cols, start=0):
+    return {
+        "winningTeam": cols[start],
+        "matchDuration": cols[start + 1],
+        "newRatingTeam1": cols[start + 2],
+        "newRatingTeam2": cols[start + 3],
+    }
 
 
-class SpellAbsorbedParser:
-    def parse(self, cols):
-        if len(cols) >= 20:
-            return {
-                "casterGUID": cols[0],
-                "casterName": cols[1],
-                "casterFlags": parse_unit_flag(cols[2]),
-                "casterRaidFlags": parse_unit_flag(cols[3]),
-                "absorbSpellId": cols[4],
-                "absorbSpellName": cols[5],
-                "absorbSpellSchool": parse_school_flag(cols[6]),
-                "amount": int(cols[7]),
-                "critical": cols[8] != "nil",
-            }
-        else:
-            return {
-                "casterGUID": None,
-                "casterName": None,
-                "casterFlags": [],
-                "casterRaidFlags": [],
-                "spellId": cols[1],
-                "spellName": cols[2],
-                "spellSchool": parse_school_flag(cols[3]),
-                "amount": int(cols[4]),
-                "critical": cols[-1] != "nil",
-            }
+def parse_void_suffix(cols, start=0):
+    return {}
+
+
+def parse_spell_absorbed(cols, start=0):
+    if len(cols) - start >= 20:
+        return {
+            "casterGUID": cols[start],
+            "casterName": cols[start + 1],
+            "casterFlags": parse_unit_flag(cols[start + 2]),
+            "casterRaidFlags": parse_unit_flag(cols[start + 3]),
+            "absorbSpellId": cols[start + 4],
+            "absorbSpellName": cols[start + 5],
+            "absorbSpellSchool": parse_school_flag(cols[start + 6]),
+            "amount": int(cols[start + 7]),
+            "critical": cols[start + 8] != "nil",
+        }
+    else:
+        return {
+            "casterGUID": None,
+            "casterName": None,
+            "casterFlags": [],
+            "casterRaidFlags": [],
+            "spellId": cols[start + 1],
+            "spellName": cols[start + 2],
+            "spellSchool": parse_school_flag(cols[start + 3]),
+            "amount": int(cols[start + 4]),
+            "critical": cols[-1] != "nil",
+        }
 
 
 class Parser:
+    # Índice de cada grupo do COMBATANT_INFO, com e sem artifact traits
+    _GROUPS_WITH_ARTIFACTS = {
+        "class_talents": 0,
+        "pvp_talents": 1,
+        "artifact_traits": 2,
+        "equipped_items": 3,
+        "interesting_auras": 4,
+    }
+    _GROUPS_WITHOUT_ARTIFACTS = {
+        "class_talents": 0,
+        "pvp_talents": 1,
+        "equipped_items": 2,
+        "interesting_auras": 3,
+    }
+
+    # Chaves de character_stats, na ordem das colunas 3 a 23 do COMBATANT_INFO
+    _STAT_KEYS = (
+        "strength",
+        "agility",
+        "stamina",
+        "intelligence",
+        "dodge",
+        "parry",
+        "block",
+        "critMelee",
+        "critRanged",
+        "critSpell",
+        "speed",
+        "lifesteal",
+        "hasteMelee",
+        "hasteRanged",
+        "hasteSpell",
+        "avoidance",
+        "mastery",
+        "versatilityDamageDone",
+        "versatilityHealingDone",
+        "versatilityDamageTaken",
+        "armor",
+    )
+
     def __init__(self):
         self.ev_prefix = {
-            "SWING": SwingParser(),
-            "SPELL_BUILDING": SpellParser(),
-            "SPELL_PERIODIC": SpellParser(),
-            "SPELL": SpellParser(),
-            "RANGE": SpellParser(),
-            "ENVIRONMENTAL": EnvParser(),
-            "WORLD": WorldPrefixParser(),
+            "SWING": parse_swing,
+            "SPELL_BUILDING": parse_spell,
+            "SPELL_PERIODIC": parse_spell,
+            "SPELL": parse_spell,
+            "RANGE": parse_spell,
+            "ENVIRONMENTAL": parse_env,
+            "WORLD": parse_world_prefix,
         }
         self.ev_suffix = {
-            "_MARKER_PLACED": WorldMarkerParser(),
-            "_HEAL_ABSORBED": HealAbsorbedParser(),
-            "_DAMAGE_SUPPORT": DamageParser(),
-            "_HEAL_SUPPORT": HealParser(),
-            "_ABSORBED_SUPPORT": SpellAbsorbedParser(),
-            "_DAMAGE": DamageParser(),
-            "_DAMAGE_LANDED": DamageParser(),
-            "_DAMAGE_LANDED_SUPPORT": DamageParser(),
-            "_MISSED": MissParser(),
-            "_HEAL": HealParser(),
-            "_ENERGIZE": EnergizeParser(),
-            "_DRAIN": DrainParser(),
-            "_LEECH": LeechParser(),
-            "_INTERRUPT": SpellBlockParser(),
-            "_DISPEL": SpellBlockParser(),
-            "_DISPEL_FAILED": SpellBlockParser(),
-            "_STOLEN": SpellBlockParser(),
-            "_EXTRA_ATTACKS": ExtraAttackParser(),
-            "_AURA_APPLIED": AuraParser(),
-            "_AURA_REMOVED": AuraParser(),
-            "_AURA_APPLIED_DOSE": AuraDoseParser(),
-            "_AURA_REMOVED_DOSE": AuraDoseParser(),
-            "_AURA_REFRESH": AuraDoseParser(),
-            "_AURA_BROKEN": AuraParser(),
-            "_AURA_BROKEN_SPELL": AuraBrokenParser(),
-            "_CAST_START": VoidSuffixParser(),
-            "_CAST_SUCCESS": VoidSuffixParser(),
-            "_CAST_FAILED": CastFailedParser(),
-            "_INSTAKILL": VoidSuffixParser(),
-            "_DURABILITY_DAMAGE": VoidSuffixParser(),
-            "_DURABILITY_DAMAGE_ALL": VoidSuffixParser(),
-            "_CREATE": VoidSuffixParser(),
-            "_SUMMON": VoidSuffixParser(),
-            "_RESURRECT": VoidSuffixParser(),
-            "_ABSORBED": SpellAbsorbedParser(),
-            "_EMPOWER_START": VoidSuffixParser(),
-            "_EMPOWER_END": VoidSuffixParser(),
-            "_EMPOWER_INTERRUPT": VoidSuffixParser(),
+            "_MARKER_PLACED": parse_world_marker,
+            "_HEAL_ABSORBED": parse_heal_absorbed,
+            "_DAMAGE_SUPPORT": parse_damage,
+            "_HEAL_SUPPORT": parse_heal,
+            "_ABSORBED_SUPPORT": parse_spell_absorbed,
+            "_DAMAGE": parse_damage,
+            "_DAMAGE_LANDED": parse_damage,
+            "_DAMAGE_LANDED_SUPPORT": parse_damage,
+            "_MISSED": parse_miss,
+            "_HEAL": parse_heal,
+            "_ENERGIZE": parse_energize,
+            "_DRAIN": parse_drain,
+            "_LEECH": parse_leech,
+            "_INTERRUPT": parse_spell_block,
+            "_DISPEL": parse_spell_block,
+            "_DISPEL_FAILED": parse_spell_block,
+            "_STOLEN": parse_spell_block,
+            "_EXTRA_ATTACKS": parse_extra_attack,
+            "_AURA_APPLIED": parse_aura,
+            "_AURA_REMOVED": parse_aura,
+            "_AURA_APPLIED_DOSE": parse_aura_dose,
+            "_AURA_REMOVED_DOSE": parse_aura_dose,
+            "_AURA_REFRESH": parse_aura_dose,
+            "_AURA_BROKEN": parse_aura,
+            "_AURA_BROKEN_SPELL": parse_aura_broken,
+            "_CAST_START": parse_void_suffix,
+            "_CAST_SUCCESS": parse_void_suffix,
+            "_CAST_FAILED": parse_cast_failed,
+            "_INSTAKILL": parse_void_suffix,
+            "_DURABILITY_DAMAGE": parse_void_suffix,
+            "_DURABILITY_DAMAGE_ALL": parse_void_suffix,
+            "_CREATE": parse_void_suffix,
+            "_SUMMON": parse_void_suffix,
+            "_RESURRECT": parse_void_suffix,
+            "_ABSORBED": parse_spell_absorbed,
+            "_EMPOWER_START": parse_void_suffix,
+            "_EMPOWER_END": parse_void_suffix,
+            "_EMPOWER_INTERRUPT": parse_void_suffix,
         }
         self.combat_player_info = {
-            "COMBATANT_INFO": CombatantInfoParser(self),
+            "COMBATANT_INFO": self.parse_combatant_info,
         }
         self.sp_event = {
-            "DAMAGE_SHIELD": (SpellParser(), DamageParser()),
-            "DAMAGE_SPLIT": (SpellParser(), DamageParser()),
-            "DAMAGE_SHIELD_MISSED": (SpellParser(), MissParser()),
-            "ENCHANT_APPLIED": (EnchantParser(), VoidSuffixParser()),
-            "ENCHANT_REMOVED": (EnchantParser(), VoidSuffixParser()),
-            "PARTY_KILL": (VoidParser(), VoidSuffixParser()),
-            "UNIT_DIED": (VoidParser(), VoidSuffixParser()),
-            "UNIT_DESTROYED": (VoidParser(), VoidSuffixParser()),
+            "DAMAGE_SHIELD": (parse_spell, parse_damage),
+            "DAMAGE_SPLIT": (parse_spell, parse_damage),
+            "DAMAGE_SHIELD_MISSED": (parse_spell, parse_miss),
+            "ENCHANT_APPLIED": (parse_enchant, parse_void_suffix),
+            "ENCHANT_REMOVED": (parse_enchant, parse_void_suffix),
+            "PARTY_KILL": (parse_void, parse_void_suffix),
+            "UNIT_DIED": (parse_void, parse_void_suffix),
+            "UNIT_DESTROYED": (parse_void, parse_void_suffix),
         }
         self.enc_event = {
-            "ENCOUNTER_START": EncountParser(),
-            "ENCOUNTER_END": EncountParser(),
+            "ENCOUNTER_START": parse_encounter,
+            "ENCOUNTER_END": parse_encounter,
         }
         self.arena_event = {
-            "ARENA_MATCH_START": ArenaMatchStartParser(),
-            "ARENA_MATCH_END": ArenaMatchEndParser(),
+            "ARENA_MATCH_START": parse_arena_match_start,
+            "ARENA_MATCH_END": parse_arena_match_end,
         }
+        # Eventos especiais (encontros e arenas) e seus parsers
+        self._special_dispatch = {**self.enc_event, **self.arena_event}
+        # Prefixos do mais longo ao mais curto, agrupados pelo primeiro token
+        self._sorted_prefixes = tuple(sorted(self.ev_prefix, key=len, reverse=True))
+        self._prefixes_by_token = {}
+        for prefix in self._sorted_prefixes:
+            token = prefix.partition("_")[0]
+            self._prefixes_by_token.setdefault(token, []).append(prefix)
+        # Todas as combinações de prefixo e sufixo resolvidas de uma só vez:
+        # o despacho de um evento vira uma única consulta ao dicionário. Os
+        # prefixos mais longos são inseridos por último e prevalecem
+        self._dispatch = dict(self.sp_event)
+        for prefix in reversed(self._sorted_prefixes):
+            prefix_parser = self.ev_prefix[prefix]
+            for suffix, suffix_parser in self.ev_suffix.items():
+                self._dispatch[prefix + suffix] = (prefix_parser, suffix_parser)
+        # O log não traz o ano; usa o ano corrente para todos os timestamps
+        self._year = datetime.datetime.today().year
+        # Timestamps já convertidos, indexados por "mês/dia hora"
+        self._timestamp_cache = {}
+        # Última linha COMBATANT_INFO processada por process_cols
+        self._groups_cols = None
+        self._groups_cache = None
+
+    def _parse_timestamp(self, date_part, time_str):
+        """
+        Convert the date and whole-second parts of a log line to epoch seconds.
+
+        Args:
+            date_part (str): The "month/day" part of the line.
+            time_str (str): The "hour:minute:second" part of the line.
+
+        Returns:
+            float: Local-time epoch seconds, without the fractional part.
+
+        Raises:
+            ValueError: If a field is malformed or out of range.
+        """
+        month, day = map(int, date_part.split("/"))
+        hour, minute, second = map(int, time_str.split(":"))
+        # datetime rejeita campos fora da faixa (ValueError), como o strptime
+        # fazia; mktime sozinho normalizaria "3/103" ou "13:12:302"
+        date_obj = datetime.datetime(self._year, month, day, hour, minute, second)
+        return time.mktime(date_obj.timetuple())
 
     def parse_line(self, line: str) -> dict:
         """
@@ -497,11 +897,15 @@ class Parser:
             dict: A dictionary containing the structured event data or error information.
         """
         try:
-            # Replace special string to avoid splitting issues
-            line = line.replace("Rated Solo Shuffle", "Rated_Solo_Shuffle")
-
             # Split into fixed parts and CSV
             terms = line.split(" ", 3)
+            if len(terms) == 4 and line.find(
+                _MATCH_TYPE, 0, len(line) - len(terms[3]) + len(_MATCH_TYPE) - 1
+            ) != -1:
+                # O tipo de partida invade as partes fixas: os espaços dele não
+                # podem contar como separadores, e a linha fica malformada
+                line = line.replace(_MATCH_TYPE, "Rated_Solo_Shuffle")
+                terms = line.split(" ", 3)
             if len(terms) < 4:
                 return {
                     "event": line.split(",")[
@@ -511,24 +915,30 @@ class Parser:
                     "raw_data": line,
                 }
 
-            # Parse date parts
-            month, day = map(int, terms[0].split("/"))
-            year = datetime.datetime.today().year
-
             # Extrair time_str e seconds
             time_str = terms[1][:-4]
             seconds = float(terms[1][-4:])
 
-            # Create timestamp
-            date_str = f"{year}/{month:02d}/{day:02d} {time_str}"
-            date_obj = datetime.datetime.strptime(date_str, "%Y/%m/%d %H:%M:%S")
-            timestamp = time.mktime(date_obj.timetuple()) + seconds
-
-            # Process CSV
+            # Muitas linhas seguidas compartilham o mesmo segundo; converte
+            # cada "mês/dia hora" uma única vez
+            stamp = f"{terms[0]} {time_str}"
+            cache = self._timestamp_cache
+            base = cache.get(stamp)
+            if base is None:
+                base = self._parse_timestamp(terms[0], time_str)
+                if len(cache) >= _TIMESTAMP_CACHE_MAX:
+                    # Descarta a entrada mais antiga (dicts mantêm a ordem)
+                    del cache[next(iter(cache))]
+                cache[stamp] = base
+
+            timestamp = base + seconds
+
+            # Process CSV; só ARENA_MATCH_START carrega o tipo de partida,
+            # então a substituição não precisa varrer as demais linhas
             csv_text = terms[3].strip()
-            csv_file = io.StringIO(csv_text)
-            reader = csv.reader(csv_file, delimiter=",")
-            columns = next(reader)
+            if csv_text.startswith("ARENA_MATCH_START"):
+                csv_text = csv_text.replace(_MATCH_TYPE, "Rated_Solo_Shuffle")
+            columns = _split_csv(csv_text)
 
             return self.parse_cols(timestamp, columns)
 
@@ -563,23 +973,26 @@ class Parser:
             se o formato das colunas for inesperado.
         """
 
-        event = cols[0]
+        # Nomes de evento, GUIDs e magias se repetem em milhões de linhas;
+        # internar as strings faz os registros compartilharem a mesma cópia
+        event = sys.intern(cols[0])
         if event in ("WORLD_MARKER_PLACED", "WORLD_MARKER_REMOVED"):
             return {}
 
-        obj = {"timestamp": ts, "event": event}
-
         try:
             if event == "COMBATANT_INFO":
                 return self.parse_combatant_info(ts, cols)
 
-            obj = self._handle_special_events(ts, cols, obj)
-            if obj:
-                return obj
-
-            obj = self._parse_base_parameters(cols, obj)
+            special = self._handle_special_events(ts, event, cols)
+            if special is not None:
+                return special
 
-            obj = self._handle_prefix_suffix_events(cols, obj)
+            # Os demais eventos saem apenas com o timestamp e o nome.
+            # _parse_base_parameters, _handle_prefix_suffix_events e
+            # _find_prefix não são chamados daqui: os parsers de sufixo ainda
+            # não pulam as colunas do advanced logging, e o parse completo só
+            # volta depois que esses offsets forem corrigidos
+            obj = {"timestamp": ts, "event": event}
 
         except ValueError as e:
             raise ValueError(
@@ -589,39 +1002,39 @@ class Parser:
 
         return obj
 
-    def _handle_special_events(self, ts: float, cols: list, obj: dict) -> dict:
+    def _handle_special_events(self, ts: float, event: str, cols: list) -> dict | None:
         """
-        Lida com eventos especiais como COMBATANT_INFO, encontros e arenas.
+        Lida com eventos especiais de encontros e arenas.
 
         Args:
             ts (float): Timestamp do evento.
+            event (str): Nome do evento.
             cols (list): Lista de colunas do evento.
-            obj (dict): Objeto base para o evento.
 
         Returns:
-            dict: Objeto atualizado com os dados do evento especial,
-            ou o objeto original se o evento não for especial.
+            dict | None: Objeto atualizado com os dados do evento especial,
+            ou None se o evento não for especial.
         """
-        event = cols[0]
-        # Simplifica a lógica de mapeamento de eventos
-        if event == "COMBATANT_INFO":
-            obj.update(self.parse_combatant_info(ts, cols[1:]))
-        elif event in self.enc_event:
-            obj.update(self.enc_event[event].parse(cols[1:]))
-        elif event in self.arena_event:
-            obj.update(self.arena_event[event].parse(cols[1:]))
+        # COMBATANT_INFO já é tratado diretamente em parse_cols
+        handler = self._special_dispatch.get(event)
+        if handler is None:
+            return None
+        obj = {"timestamp": ts, "event": event}
+        obj.update(handler(cols, 1))
         return obj
 
-    def _parse_base_parameters(self, cols: list, obj: dict) -> dict:
+    def _parse_base_parameters(self, ts: float, event: str, cols: list) -> dict:
         """
-        Analisa os parâmetros base de um evento (GUIDs, nomes, flags).
+        Monta o objeto base de um evento (timestamp, GUIDs, nomes, flags).
+        Não usado por parse_cols no momento (veja o comentário ali).
 
         Args:
+            ts (float): Timestamp do evento.
+            event (str): Nome do evento.
             cols (list): Lista de colunas do evento.
-            obj (dict): Objeto base para o evento.
 
         Returns:
-            dict: Objeto atualizado com os parâmetros base.
+            dict: Objeto do evento com os parâmetros base.
         """
         # Adiciona uma verificação mais robusta para o comprimento das colunas
         if len(cols) < 9:
@@ -630,24 +1043,24 @@ class Parser:
                 f"número insuficiente de colunas ({len(cols)} < 9)"
             )
 
-        # Simplifica a extração de flags
-        obj.update(
-            {
-                "sourceGUID": cols[1],
-                "sourceName": cols[2],
-                "sourceFlags": parse_unit_flag(cols[3]),
-                "sourceRaidFlags": parse_unit_flag(cols[4]),
-                "destGUID": cols[5],
-                "destName": cols[6],
-                "destFlags": parse_unit_flag(cols[7]),
-                "destRaidFlags": parse_unit_flag(cols[8]),
-            }
-        )
-        return obj
+        # Um único literal, sem dicionários temporários para obj.update
+        return {
+            "timestamp": ts,
+            "event": event,
+            "sourceGUID": sys.intern(cols[1]),
+            "sourceName": cols[2],
+            "sourceFlags": parse_unit_flag(cols[3]),
+            "sourceRaidFlags": parse_unit_flag(cols[4]),
+            "destGUID": sys.intern(cols[5]),
+            "destName": cols[6],
+            "destFlags": parse_unit_flag(cols[7]),
+            "destRaidFlags": parse_unit_flag(cols[8]),
+        }
 
     def _handle_prefix_suffix_events(self, cols: list, obj: dict) -> dict:
         """
         Lida com eventos que possuem prefixos e sufixos.
+        Não usado por parse_cols no momento (veja o comentário ali).
 
         Args:
             cols (list): Lista de colunas do evento.
@@ -658,25 +1071,24 @@ class Parser:
         """
         event = cols[0]
 
-        # Tenta encontrar um sufixo primeiro
+        entry = self._dispatch.get(event)
+        if entry is not None:
+            prefix_parser, suffix_parser = entry
+            result, start = prefix_parser(cols, 9)
+            obj.update(result)
+            obj.update(suffix_parser(cols, start))
+            return obj
+
+        # Eventos que são apenas um sufixo
         suffix_parser = self.ev_suffix.get(event)
         if suffix_parser:
-            obj.update(suffix_parser.parse(cols[9:]))
+            obj.update(suffix_parser(cols, 9))
             return obj
 
-        # Se não houver sufixo, procura por um prefixo
+        # Um prefixo conhecido fora da tabela tem um sufixo desconhecido
         prefix = self._find_prefix(event)
         if prefix:
-            return self._parse_prefix_suffix(prefix, event, cols, obj)
-
-        # Se não houver prefixo nem sufixo, tenta os eventos especiais
-        parser_tuple = self.sp_event.get(event)
-        if parser_tuple:
-            prefix_parser, suffix_parser = parser_tuple
-            result, remaining = prefix_parser.parse(cols[9:])
-            obj.update(result)
-            obj.update(suffix_parser.parse(remaining))
-            return obj
+            raise ValueError(f"Sufixo de evento desconhecido: {event[len(prefix) :]}")
 
         # Se nada for encontrado, levanta um erro
         raise ValueError(f"Formato de evento desconhecido: {event}")
@@ -684,6 +1096,7 @@ class Parser:
     def _find_prefix(self, event: str) -> str | None:
         """
         Encontra o prefixo mais longo que corresponde ao início do evento.
+        Só é chamado por _handle_prefix_suffix_events.
 
         Args:
             event (str): Nome do evento.
@@ -691,265 +1104,164 @@ class Parser:
         Returns:
             str | None: O prefixo encontrado ou None se nenhum prefixo for encontrado.
         """
-        for prefix in sorted(self.ev_prefix, key=len, reverse=True):
-            if event.startswith(prefix):
+        startswith = event.startswith
+        # Só os prefixos com o mesmo primeiro token podem casar (e o mais
+        # longo deles vence qualquer outro)
+        for prefix in self._prefixes_by_token.get(event.partition("_")[0], ()):
+            if startswith(prefix):
                 return prefix
+        # Um prefixo sem "_" ainda pode casar com um token mais longo
+        sorted_prefixes = self._sorted_prefixes
+        if startswith(sorted_prefixes):
+            for prefix in sorted_prefixes:
+                if startswith(prefix):
+                    return prefix
         return None
 
-    def _parse_prefix_suffix(
-        self, prefix: str, event: str, cols: list, obj: dict
-    ) -> dict:
-        """
-        Analisa um evento com prefixo e sufixo.
-
-        Args:
-            prefix (str): Prefixo do evento.
-            event (str): Nome do evento completo.
-            cols (list): Lista de colunas do evento.
-            obj (dict): Objeto base para o evento.
-
-        Returns:
-            dict: Objeto atualizado com os dados do evento.
-        """
-        suffix = event[len(prefix) :]
-        suffix_parser = self.ev_suffix.get(suffix)
-        if not suffix_parser:
-            raise ValueError(f"Sufixo de evento desconhecido: {suffix}")
-
-        prefix_parser = self.ev_prefix[prefix]
-        result, remaining = prefix_parser.parse(cols[9:])
-        obj.update(result)
-        suffix_parser.raw = cols  # Atribui os dados brutos ao parser de sufixo
-        obj.update(suffix_parser.parse(remaining))
-        return obj
-
     def read_file(self, fname):
         if not os.path.exists(fname):
             logging.error("File not found: %s", fname)
             return
         try:
-            with open(fname, "r", encoding="utf-8", buffering=8192) as file:
-                first_line = file.readline()
-                if not first_line or first_line.isspace() or "\x00" in first_line:
+            with open(fname, "rb") as file:
+                if os.fstat(file.fileno()).st_size == 0:
                     logging.warning("Corrupted file: %s", fname)
                     return
-                if "ARENA_MATCH_START" not in first_line:
-                    logging.warning("Invalid file format: %s", fname)
-                    return
-                yield self.parse_line(first_line)
-                for line in file:
-                    if line.strip():
-                        try:
-                            yield self.parse_line(line)
-                        except ValueError as e:
-                            logging.error("Error parsing line in file %s: %s", fname, e)
-                            logging.error("Line with error: %s", line)
-                            return
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    lines = _iter_lines(buf)
+                    first_line = next(lines)
+                    if not self._check_first_line(fname, first_line):
+                        return
+                    # Método resolvido uma única vez para o laço por linha
+                    parse_line = self.parse_line
+                    yield parse_line(first_line)
+                    for line in lines:
+                        if line.strip():
+                            try:
+                                yield parse_line(line)
+                            except ValueError as e:
+                                logging.error(
+                                    "Error parsing line in file %s: %s", fname, e
+                                )
+                                logging.error("Line with error: %s", line)
+                                return
         except IOError as e:
             logging.error("Error reading file: %s", e)
 
-    def extract_spec_info(self, spec_id):
-        data = [
-            {
-                "Class": "Death Knight",
-                "Specs": {
-                    250: "Blood",
-                    251: "Frost",
-                    252: "Unholy",
-                    1455: "Initial",
-                },
-            },
-            {
-                "Class": "Demon Hunter",
-                "Specs": {
-                    577: "Havoc",
-                    581: "Vengeance",
-                    1456: "Initial",
-                },
-            },
-            {
-                "Class": "Druid",
-                "Specs": {
-                    102: "Balance",
-                    103: "Feral",
-                    104: "Guardian",
-                    105: "Restoration",
-                    1447: "Initial",
-                },
-            },
-            {
-                "Class": "Evoker",
-                "Specs": {
-                    1467: "Devastation",
-                    1468: "Preservation",
-                    1473: "Augmentation",
-                    1465: "Initial",
-                },
-            },
-            {
-                "Class": "Hunter",
-                "Specs": {
-                    253: "Beast Mastery",
-                    254: "Marksmanship",
-                    255: "Survival",
-                    1448: "Initial",
-                },
-            },
-            {
-                "Class": "Mage",
-                "Specs": {
-                    62: "Arcane",
-                    63: "Fire",
-                    64: "Frost",
-                    1449: "Initial",
-                },
-            },
-            {
-                "Class": "Monk",
-                "Specs": {
-                    268: "Brewmaster",
-                    270: "Mistweaver",
-                    269: "Windwalker",
-                    1450: "Initial",
-                },
-            },
-            {
-                "Class": "Paladin",
-                "Specs": {
-                    65: "Holy",
-                    66: "Protection",
-                    70: "Retribution",
-                    1451: "Initial",
-                },
-            },
-            {
-                "Class": "Priest",
-                "Specs": {
-                    256: "Discipline",
-                    257: "Holy",
-                    258: "Shadow",
-                    1452: "Initial",
-                },
-            },
-            {
-                "Class": "Rogue",
-                "Specs": {
-                    259: "Assassination",
-                    260: "Outlaw",
-                    261: "Subtlety",
-                    1453: "Initial",
-                },
-            },
-            {
-                "Class": "Shaman",
-                "Specs": {
-                    262: "Elemental",
-                    263: "Enhancement",
-                    264: "Restoration",
-                    1444: "Initial",
-                },
-            },
-            {
-                "Class": "Warlock",
-                "Specs": {
-                    265: "Affliction",
-                    266: "Demonology",
-                    267: "Destruction",
-                    1454: "Initial",
-                },
-            },
-            {
-                "Class": "Warrior",
-                "Specs": {
-                    71: "Arms",
-                    72: "Fury",
-                    73: "Protection",
-                    1446: "Initial",
-                },
-            },
-        ]
+    def read_file_batched(self, fname, batch_size=_WRITE_BATCH):
+        """
+        Group the events of read_file into lists.
 
-        for player_class_data in data:
-            if spec_id in player_class_data["Specs"]:
-                return {
-                    "id": spec_id,
-                    "class": player_class_data["Class"],
-                    "spec": player_class_data["Specs"][spec_id],
-                }
-        return {"id": spec_id, "class": "Unknown", "spec": "Unknown"}
+        Args:
+            fname (str): Path of the log file.
+            batch_size (int): Maximum number of events per list.
 
-    def process_cols(self, cols, group_type):
-        combined_string = ",".join(cols).replace("@", ",")
+        Yields:
+            list: Consecutive events, in file order.
+        """
+        events = self.read_file(fname)
+        while batch := list(islice(events, batch_size)):
+            yield batch
+
+    @staticmethod
+    def _check_first_line(fname, first_line):
+        """Valida a primeira linha do log (arquivo corrompido ou sem arena)."""
+        if first_line.isspace() or "\x00" in first_line:
+            logging.warning("Corrupted file: %s", fname)
+            return False
+        if "ARENA_MATCH_START" not in first_line:
+            logging.warning("Invalid file format: %s", fname)
+            return False
+        return True
 
-        def find_delimiters(combined_string, delimiters):
-            groups = []
-            stack = []
-            start_index = -1
-
-            for i, char in enumerate(combined_string):
-                if char in delimiters["open"]:
-                    stack.append(char)
-                    if len(stack) == 1:
-                        start_index = i
-                elif char in delimiters["close"] and stack:
-                    stack.pop()
-                    if not stack:
-                        groups.append((start_index, i))
-            return groups
-
-        delimiters = {"open": ["[", "("], "close": ["]", ")"]}
-        groups = find_delimiters(combined_string, delimiters)
-        artifact_traits_present = len(groups) > 4
-
-        group_mapping = {
-            "class_talents": 0,
-            "pvp_talents": 1,
-            "artifact_traits": 2 if artifact_traits_present else None,
-            "equipped_items": 3 if artifact_traits_present else 2,
-            "interesting_auras": 4 if artifact_traits_present else 3,
-        }
+    def extract_spec_info(self, spec_id):
+        return _spec_info(spec_id)
 
-        def extract_group(combined_string, group_indices, index):
-            start, end = group_indices[index]
-            return combined_string[start + 1 : end].split(",", end - start - 1)
+    def _find_groups(self, cols):
+        combined_string = ",".join(cols).replace("@", ",")
 
+        # Percorre só os delimitadores, localizados em C pela regex, em vez de
+        # cada caractere da linha; um grupo vai do primeiro "[" ou "(" até o
+        # fechamento que zera a profundidade
+        groups = []
+        depth = 0
+        start_index = -1
+        for match in _BRACKET_REGEX.finditer(combined_string):
+            if match.group() in _OPEN_BRACKETS:
+                depth += 1
+                if depth == 1:
+                    start_index = match.start()
+            elif depth:
+                depth -= 1
+                if not depth:
+                    groups.append((start_index, match.start()))
+
+        if len(groups) > 4:
+            group_mapping = self._GROUPS_WITH_ARTIFACTS
+        else:
+            group_mapping = self._GROUPS_WITHOUT_ARTIFACTS
+        return combined_string, groups, group_mapping
+
+    def _groups(self, cols):
+        # Os grupos são localizados uma única vez por linha; as chamadas
+        # seguintes com a mesma lista de colunas reutilizam o resultado
+        if cols is not self._groups_cols:
+            self._groups_cache = self._find_groups(cols)
+            self._groups_cols = cols
+        return self._groups_cache
+
+    def _group_text(self, cols, group_type):
+        """Texto de um grupo do COMBATANT_INFO sem os delimitadores externos."""
+        combined_string, groups, group_mapping = self._groups(cols)
+        index = group_mapping.get(group_type)
+        if index is None:
+            return None
+        start, end = groups[index]
+        return combined_string[start + 1 : end]
+
+    def process_cols(self, cols, group_type):
         if group_type == "pvpStats":
-            return combined_string.split(",")[-4:]
+            return self._groups(cols)[0].rsplit(",", 4)[-4:]
 
-        index = group_mapping.get(group_type)
-        if index is not None:
-            group_data = extract_group(combined_string, groups, index)
-        else:
-            group_data = []
-        return group_data
+        group_text = self._group_text(cols, group_type)
+        if group_text is None:
+            return []
+        return group_text.split(",")
 
     def extract_class_talents(self, cols):
-        class_talents_raw = self.process_cols(cols, "class_talents")
-        class_talents = []
-        for i in range(0, len(class_talents_raw), 3):
-            talent_group = class_talents_raw[i : i + 3]
-            talent_id, spell_id, rank = [int(part.strip("()")) for part in talent_group]
-            talent_info = {"talentId": talent_id, "spellId": spell_id, "rank": rank}
-            class_talents.append(talent_info)
-        return class_talents
+        group_text = self._group_text(cols, "class_talents")
+        if group_text is None:
+            return []
+        # Remove os parênteses do grupo inteiro de uma vez, em C, e consome o
+        # mesmo iterador três vezes para formar as triplas sem fatiar
+        class_talents_raw = iter(group_text.translate(_PARENS).split(","))
+        return [
+            {
+                "talentId": _cached_int(talent_id),
+                "spellId": _cached_int(spell_id),
+                "rank": _cached_int(rank),
+            }
+            for talent_id, spell_id, rank in zip(
+                class_talents_raw, class_talents_raw, class_talents_raw, strict=True
+            )
+        ]
 
     def extract_pvp_talents(self, cols):
-        pvp_talents_raw = self.process_cols(cols, "pvp_talents")
-        pvp_talents_info = {}
-        for i, talent in enumerate(pvp_talents_raw):
-            talent_id = int(talent.strip("()"))
-            talent_key = f"pvp_talent_{i + 1}"
-            pvp_talents_info[talent_key] = talent_id
-        return pvp_talents_info
+        group_text = self._group_text(cols, "pvp_talents")
+        if group_text is None:
+            return {}
+        return {
+            f"pvp_talent_{i}": _cached_int(talent)
+            for i, talent in enumerate(group_text.translate(_PARENS).split(","), 1)
+        }
 
     def extract_equipped_items(self, cols):
         """
         Extrai e reconstrói itens equipados a partir de dados brutos de coluna.
 
-        Esse método processa uma lista de dados brutos de itens equipados, reconstruindo
-        reconstruindo-a em dicionários estruturados para cada item. Ele lida com
-        partes do item entre parênteses e garante que elas estejam corretamente
-        balanceadas e formatados antes de extrair os detalhes relevantes.
+        Esse método localiza os parênteses do grupo de itens equipados em uma única
+        varredura e recorta cada item de nível zero diretamente da string, sem
+        reconstruí-lo parte por parte, antes de extrair os detalhes relevantes.
 
         Args:
             cols (lista): Lista de cadeias de caracteres que representam as colunas do
@@ -964,47 +1276,38 @@ class Parser:
             ValueError: Se os parênteses nos dados brutos estiverem desequilibrados.
         """
 
-        equipped_items_raw = self.process_cols(cols, "equipped_items")
+        # Usa o texto do grupo diretamente, sem dividir e juntar as colunas
+        equipped_items_raw = self._group_text(cols, "equipped_items") or ""
         reconstructed_dicts = []
-        temp_item_parts = []  # Utilizar lista para acumular partes do item
         parenthesis_count = 0
-        n = len(equipped_items_raw)
-
-        for i, item_part in enumerate(equipped_items_raw):
-            temp_item_parts.append(item_part)
-            # Atualizar o contador de parênteses
-            parenthesis_count += item_part.count("(") - item_part.count(")")
-
-            # Verificar se deve adicionar uma vírgula
-            if i < n - 1:
-                next_part = equipped_items_raw[i + 1]
-                if not (item_part.endswith(")") and next_part.startswith("(")) or (
-                    item_part == "()" and next_part == "()"
-                ):
-                    temp_item_parts.append(",")
-
-            # Quando os parênteses estiverem balanceados, processar o item
-            if parenthesis_count == 0 and temp_item_parts:
-                temp_item = "".join(temp_item_parts)
-                # Substituições específicas para garantir o formato correto
-                temp_item = temp_item.replace("()()", "(),()").replace(")(", "),(")
-                parts = temp_item.strip("()").split(",")
-
-                # Construir o dicionário do item de forma mais eficiente
-                item_dict = {
-                    "item_id": int(parts[0]),
-                    "item_level": int(parts[1]),
-                    "enchantments": [
-                        int(x) for x in parts[2].strip("()").split(",") if x
-                    ],
-                    "bonus_list": [
-                        int(x) for x in parts[3].strip("()").split(",") if x
-                    ],
-                    "gems": [int(x) for x in parts[4].strip("()").split(",") if x],
-                }
-                reconstructed_dicts.append(item_dict)
-                # Resetar as partes temporárias para o próximo item
-                temp_item_parts = []
+        item_start = 0
+
+        # Percorre apenas as posições dos parênteses; cada par de nível zero
+        # delimita um item inteiro
+        for match in _PAREN_REGEX.finditer(equipped_items_raw):
+            if match.group() == "(":
+                if parenthesis_count == 0:
+                    item_start = match.start()
+                parenthesis_count += 1
+                continue
+            if parenthesis_count == 0:
+                raise ValueError("Parênteses desbalanceados na entrada")
+            parenthesis_count -= 1
+            if parenthesis_count:
+                continue
+
+            item = equipped_items_raw[item_start : match.end()]
+            parts = item.strip("()").split(",")
+
+            # Construir o dicionário do item de forma mais eficiente
+            item_dict = {
+                "item_id": int(parts[0]),
+                "item_level": int(parts[1]),
+                "enchantments": _to_ints(parts[2]),
+                "bonus_list": _to_ints(parts[3]),
+                "gems": _to_ints(parts[4]),
+            }
+            reconstructed_dicts.append(item_dict)
 
         # Verificar se os parênteses estão balanceados
         if parenthesis_count != 0:
@@ -1017,11 +1320,14 @@ class Parser:
         auras_extracted = []
         if not auras_raw or all(element == "" for element in auras_raw):
             return auras_extracted
-        for i in range(0, len(auras_raw), 2):
-            player_guid = auras_raw[i]
-            spell_id = auras_raw[i + 1]
+        # Consome o mesmo iterador duas vezes para formar os pares (GUID, magia)
+        auras_iter = iter(auras_raw)
+        for player_guid, spell_id in zip(auras_iter, auras_iter, strict=True):
             if player_guid and spell_id.isdigit():
-                aura_dict = {"player_guid": player_guid, "spell_id": int(spell_id)}
+                aura_dict = {
+                    "player_guid": sys.intern(player_guid),
+                    "spell_id": _cached_int(spell_id),
+                }
                 auras_extracted.append(aura_dict)
         return auras_extracted
 
@@ -1034,45 +1340,22 @@ class Parser:
                 f"List content: {pvp_stats_raw}"
             )
             raise ValueError(error_message)
-        pvp_stats = [int(stat) for stat in pvp_stats_raw]
-        pvp_stats_dict = {
-            "honor_level": pvp_stats[0],
-            "season": pvp_stats[1],
-            "rating": pvp_stats[2],
-            "tier": pvp_stats[3],
+        honor_level, season, rating, tier = map(int, pvp_stats_raw)
+        return {
+            "honor_level": honor_level,
+            "season": season,
+            "rating": rating,
+            "tier": tier,
         }
-        return pvp_stats_dict
 
     def parse_combatant_info(self, ts, cols):
 
         info = {
             "timestamp": ts,
             "event": "COMBATANT_INFO",
-            "playerguid": cols[1],
+            "playerguid": sys.intern(cols[1]),
             "faction": int(cols[2]),
-            "character_stats": {
-                "strength": int(cols[3]),
-                "agility": int(cols[4]),
-                "stamina": int(cols[5]),
-                "intelligence": int(cols[6]),
-                "dodge": int(cols[7]),
-                "parry": int(cols[8]),
-                "block": int(cols[9]),
-                "critMelee": int(cols[10]),
-                "critRanged": int(cols[11]),
-                "critSpell": int(cols[12]),
-                "speed": int(cols[13]),
-                "lifesteal": int(cols[14]),
-                "hasteMelee": int(cols[15]),
-                "hasteRanged": int(cols[16]),
-                "hasteSpell": int(cols[17]),
-                "avoidance": int(cols[18]),
-                "mastery": int(cols[19]),
-                "versatilityDamageDone": int(cols[20]),
-                "versatilityHealingDone": int(cols[21]),
-                "versatilityDamageTaken": int(cols[22]),
-                "armor": int(cols[23]),
-            },
+            "character_stats": dict(zip(self._STAT_KEYS, map(int, cols[3:24]))),
             "currentSpecID": self.extract_spec_info(int(cols[24])),
             "classTalents": self.extract_class_talents(cols),
             "pvpTalents": self.extract_pvp_talents(cols),
@@ -1084,15 +1367,36 @@ class Parser:
         return info
 
 
-class CombatantInfoParser:
-    def __init__(self, parser):
-        self.parser = parser
+def _dumps(obj, pretty=None):
+    """
+    Serializa um objeto em JSON (bytes), usando orjson quando disponível.
+    Sem pretty, segue o valor atual de PRETTY.
+    """
+    if pretty is None:
+        pretty = PRETTY
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data):
+    """Desserializa JSON (bytes), usando orjson quando disponível."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
-    def parse(self, ts, cols):
-        return self.parser.parse_combatant_info(ts, cols)
+# Indica se o logging já foi configurado neste processo
+_LOGGING_CONFIGURED = False
 
 
 def setup_logging(log_file="convert_logs.log"):
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+    _LOGGING_CONFIGURED = True
     for handler in logging.root.handlers[:]:
         logging.root.removeHandler(handler)
     logging.basicConfig(
@@ -1102,27 +1406,87 @@ def setup_logging(log_file="convert_logs.log"):
     )
 
 
-def process_single_file(args):
-    parser, file_path, output_dir = args
+# Estado de cada processo do pool, definido em _init_worker
+_PARSER = None
+_OUTPUT_DIR = None
+
+
+def _init_worker(output_dir):
+    """Configura o logging e cria o Parser uma única vez por processo do pool."""
+    global _PARSER, _OUTPUT_DIR
     setup_logging()
-    output_file_path = output_dir / f"{file_path.stem}.json"
+    _PARSER = Parser()
+    _OUTPUT_DIR = output_dir
+
+
+def _write_parts(output_file_path, blocks):
+    """
+    Grava blocos já codificados em ordem, sobrepondo codificação e escrita.
+
+    Os blocos são produzidos na thread atual e enviados para uma única
+    thread de I/O, que os grava enquanto o parser avança. O número de
+    blocos pendentes é limitado para manter a memória constante.
+    """
+    with open(output_file_path, "wb", buffering=_BUFFER_SIZE) as raw:
+        f = gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=1) if GZIP else raw
+        with f, ThreadPoolExecutor(max_workers=1) as io_executor:
+            pending = deque()
+            for block in blocks:
+                if len(pending) >= _MAX_PENDING_WRITES:
+                    pending.popleft().result()
+                pending.append(io_executor.submit(f.write, block))
+            for future in pending:
+                future.result()
+
+
+def write_json_array(output_file_path, batches):
+    """Escreve os lotes de registros como um único array JSON."""
+    # Lido uma única vez: separador e registros seguem o mesmo modo
+    pretty = PRETTY
+    separator = b", " if pretty else b","
+
+    def blocks():
+        prefix = b"["
+        for batch in batches:
+            if pretty:
+                body = separator.join([_dumps(data, pretty=True) for data in batch])
+            else:
+                # Um único dumps por lote; sem os colchetes, a lista compacta
+                # é exatamente os registros separados por ","
+                body = _dumps(batch, pretty=False)[1:-1]
+            yield prefix + body
+            prefix = separator
+        yield b"]"
+
+    _write_parts(output_file_path, blocks())
+
+
+def write_json_lines(output_file_path, batches):
+    """Escreve os registros em NDJSON: um objeto JSON compacto por linha."""
+    _write_parts(
+        output_file_path,
+        (
+            b"".join([_dumps(data, pretty=False) + b"\n" for data in batch])
+            for batch in batches
+        ),
+    )
+
+
+def process_single_file(file_path):
+    output_file_path = _OUTPUT_DIR / f"{file_path.stem}{OUTPUT_SUFFIX}"
 
-    if output_file_path.exists():
-        return
     try:
-        logging.debug(f"Processing file: {file_path}")
-        data_generator = parser.read_file(str(file_path))
-        first_item = next(data_generator, None)
-
-        if first_item:
-            logging.debug(f"First item: {first_item}")
-            with open(output_file_path, "w", encoding="utf-8") as f:
-                f.write("[")
-                json.dump(first_item, f, ensure_ascii=False, indent=4)
-                for data in data_generator:
-                    f.write(", ")
-                    json.dump(data, f, ensure_ascii=False, indent=4)
-                f.write("]")
+        logging.debug("Processing file: %s", file_path)
+        batches = _PARSER.read_file_batched(str(file_path))
+        first_batch = next(batches, None)
+
+        if first_batch:
+            logging.debug("First item: %s", first_batch[0])
+            batches = chain((first_batch,), batches)
+            if NDJSON:
+                write_json_lines(output_file_path, batches)
+            else:
+                write_json_array(output_file_path, batches)
 
             logging.info("JSON file written: %s", output_file_path)
 
@@ -1130,14 +1494,39 @@ def process_single_file(args):
         logging.error("Error processing %s: %s", file_path, e)
 
 
-def process_files(parser, txt_files, output_dir, max_workers=None):
+def process_files(txt_files, output_dir, max_workers=None):
+    # Uma única listagem do diretório de saída substitui um stat por arquivo
+    # nos workers; arquivos já convertidos nem chegam à fila do pool
+    # normcase iguala maiúsculas e minúsculas no Windows, como o
+    # Path.exists() que a listagem substituiu
+    normcase = os.path.normcase
+    try:
+        done = {normcase(name) for name in os.listdir(output_dir)}
+    except FileNotFoundError:
+        # Sem diretório de saída não há nada convertido; cada worker registra
+        # o erro ao tentar gravar, como antes
+        done = set()
+    txt_files = [
+        path
+        for path in txt_files
+        if normcase(f"{path.stem}{OUTPUT_SUFFIX}") not in done
+    ]
     if max_workers is None:
-        max_workers = min(4, cpu_count())
-    with Pool(processes=max_workers) as pool:
-        args = [(parser, file_path, output_dir) for file_path in txt_files]
+        max_workers = cpu_count()
+    total = len(txt_files)
+    # Cerca de quatro lotes por processo equilibram a carga entre arquivos de
+    # tamanhos diferentes sem multiplicar as trocas de mensagens do pool
+    chunksize = max(1, min(32, total // (max_workers * 4)))
+    with Pool(
+        processes=max_workers, initializer=_init_worker, initargs=(output_dir,)
+    ) as pool:
         for _ in tqdm(
-            pool.imap_unordered(process_single_file, args),
-            total=len(txt_files),
+            pool.imap_unordered(process_single_file, txt_files, chunksize=chunksize),
+            total=total,
+            # Limita os redesenhos da barra a ~200, independentemente do total
+            mininterval=0.5,
+            miniters=max(1, total // 200),
+            smoothing=0.05,
             desc=f"{Fore.GREEN}{ICON_CONVERTING}...{Style.RESET_ALL}",
             bar_format="{l_bar}%s{bar}%s{r_bar}"
             % (Fore.LIGHTGREEN_EX, Style.RESET_ALL),
@@ -1146,15 +1535,27 @@ def process_files(parser, txt_files, output_dir, max_workers=None):
             pass
 
 
+# Console compartilhado pelas mensagens do processo principal
+_CONSOLE = None
+
+
+def get_console():
+    """Cria o Console do Rich na primeira chamada e o reutiliza nas demais."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        custom_theme = Theme(
+            {
+                "created": "bold yellow",
+                "exists": "bold green",
+                "error": "bold red",
+            }
+        )
+        _CONSOLE = Console(theme=custom_theme)
+    return _CONSOLE
+
+
 def check_and_create_directories(input_dir, output_dir):
-    custom_theme = Theme(
-        {
-            "created": "bold yellow",
-            "exists": "bold green",
-            "error": "bold red",
-        }
-    )
-    console = Console(theme=custom_theme)
+    console = get_console()
 
     results = []
     for directory in [input_dir, output_dir]:
@@ -1189,37 +1590,56 @@ def check_and_create_directories(input_dir, output_dir):
 
     console.print(table)
 
+    return all(style != "error" for _, _, style in results)
+
 
 def run_verification_test(parser, test_input_file, expected_output_file):
-    console = Console()
+    console = get_console()
     console.print(f"Execução do teste de verificação em {test_input_file.name}...")
 
-    # Inicializa o profiler
-    profiler = cProfile.Profile()
-    profiler.enable()
+    expected_output_path = Path(expected_output_file)
+    data_expected = None
+    if expected_output_path.exists():
+        with open(expected_output_file, "rb") as f:
+            data_expected = _loads(f.read())
+
+    # O profiler deixa o parse bem mais lento; só é ligado sob demanda
+    profiler = cProfile.Profile() if PROFILE else None
+    if profiler is not None:
+        profiler.enable()
 
     start_time = time.perf_counter()  # Inicia a contagem de tempo
-    data_generated = list(parser.read_file(str(test_input_file)))
+    events = parser.read_file(str(test_input_file))
+    mismatch = None
+    if data_expected is None:
+        deque(events, maxlen=0)
+    else:
+        # Compara os eventos à medida que são gerados, sem materializar a
+        # lista inteira, e para na primeira divergência
+        missing = object()
+        pairs = zip_longest(events, data_expected, fillvalue=missing)
+        for index, (generated, expected) in enumerate(pairs):
+            if generated != expected:
+                mismatch = index
+                break
     end_time = time.perf_counter()  # Finaliza a contagem de tempo
 
-    profiler.disable()
     duration = end_time - start_time  # Calcula a duração em segundos
 
-    # Cria um objeto Stats a partir do profiler
-    stats = pstats.Stats(profiler).sort_stats("cumulative")
+    if profiler is not None:
+        profiler.disable()
+        # Cria um objeto Stats a partir do profiler
+        stats = pstats.Stats(profiler).sort_stats("cumulative")
 
-    # Exibe os 10 principais gargalos
-    stats.print_stats(10)
+        # Exibe os 10 principais gargalos
+        stats.print_stats(10)
 
-    expected_output_path = Path(expected_output_file)
-    if not expected_output_path.exists():
+    if data_expected is None:
         console.print(
             f"[red]O arquivo de saída esperado não foi encontrado: {expected_output_file}[/red]"
         )
         return False, duration
-    with open(expected_output_file, "r", encoding="utf-8") as f:
-        data_expected = json.load(f)
-    if data_generated == data_expected:
+    if mismatch is None:
         console.print(
             f"[green]{ICON_SUCCESS} O teste de verificação foi aprovado![/green]"
         )
@@ -1227,10 +1647,36 @@ def run_verification_test(parser, test_input_file, expected_output_file):
         return True, duration
     else:
         console.print(f"[red]{ICON_SUCCESS} O teste de verificação falhou![/red]")
+        console.print(f"Primeiro evento divergente: {mismatch}")
         console.print(f"Time taken: {duration:.2f} segundos.")
         return False, duration
 
 
+def _verification_key(test_input_file, expected_output_file):
+    """Assinatura da entrada, da saída esperada e do próprio conversor."""
+    paths = (Path(test_input_file), Path(expected_output_file), Path(__file__))
+    try:
+        stats = [path.stat() for path in paths]
+    except OSError:
+        return None
+    return ";".join(f"{st.st_mtime_ns}:{st.st_size}" for st in stats)
+
+
+def _load_verified_key(cache_path):
+    """Lê a assinatura da última verificação aprovada, se houver."""
+    try:
+        with open(cache_path, "rb") as f:
+            return _loads(f.read()).get("key")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _save_verified_key(cache_path, key):
+    """Registra a assinatura de uma verificação aprovada."""
+    with open(cache_path, "wb") as f:
+        f.write(_dumps({"key": key}, pretty=False))
+
+
 def main():
     """Função principal que gerencia a criação do diretório de saída,
     configuração de logging e processamento dos arquivos de entrada.
@@ -1238,7 +1684,9 @@ def main():
     setup_logging()
     input_dir = Path(r"E:\LogsWOW\logs")
     output_dir = Path(r"D:\Projetos_Git\dlLogs\scripts\output_json")
-    check_and_create_directories(input_dir, output_dir)
+    if not check_and_create_directories(input_dir, output_dir):
+        logging.error("Não foi possível preparar os diretórios. Saindo.")
+        return
 
     parser = Parser()
     txt_files = list(input_dir.glob("*.txt"))
@@ -1249,21 +1697,38 @@ def main():
     test_input_file = input_dir / "0026580d3a9a5e6909e407211cbe51e2.txt"
     expected_output_file = output_dir / "0026580d3a9a5e6909e407211cbe51e2.json"
 
-    # Run verification test
-    test_passed = run_verification_test(parser, test_input_file, expected_output_file)
-    if not test_passed:
-        logging.error("Falha no teste de verificação. Saindo.")
-        return
+    # Run verification test, unless nothing changed since the last pass
+    cache_path = output_dir / _VERIFY_CACHE_NAME
+    key = _verification_key(test_input_file, expected_output_file)
+    if not expected_output_file.exists():
+        # A referência é gravada pelo próprio process_files; sem ela não há
+        # com o que comparar, e sair aqui impediria que fosse criada
+        logging.warning(
+            "Saída esperada %s não encontrada; pulando a verificação. "
+            "A conversão em .json deste diretório a gera.",
+            expected_output_file,
+        )
+    elif key is not None and key == _load_verified_key(cache_path):
+        logging.info("Verificação já aprovada para estes arquivos; pulando.")
+    else:
+        test_passed, _ = run_verification_test(
+            parser, test_input_file, expected_output_file
+        )
+        if not test_passed:
+            logging.error("Falha no teste de verificação. Saindo.")
+            return
+        if key is not None:
+            _save_verified_key(cache_path, key)
 
     # Ask user to continue
-    console = Console()
+    console = get_console()
     console.print("Deseja continuar processando o diretório atual? (S/N)")
     choice = input().strip().upper()
     if choice != "S":
         console.print("Saindo...")
         return
 
-    process_files(parser, txt_files, output_dir)
+    process_files(txt_files, output_dir)
 
 
 if __name__ == "__main__":
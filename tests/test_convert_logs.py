@@ -0,0 +1,236 @@
+import datetime
+import gzip
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from scripts import convert_logs
+from scripts.convert_logs import Parser, _split_csv
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+SAMPLE_LOG = SCRIPTS_DIR / "dados_brutos_teste_v1.txt"
+
+HOSTILE_PLAYER_FLAGS = [
+    "AFFILIATION_OUTSIDER",
+    "AFFILIATION_MASK",
+    "REACTION_HOSTILE",
+    "REACTION_MASK",
+    "CONTROL_PLAYER",
+    "CONTROL_MASK",
+    "TYPE_PLAYER",
+    "TYPE_MASK",
+]
+PARTY_PLAYER_FLAGS = [
+    "AFFILIATION_PARTY",
+    "AFFILIATION_MASK",
+    "REACTION_FRIENDLY",
+    "REACTION_MASK",
+    "CONTROL_PLAYER",
+    "CONTROL_MASK",
+    "TYPE_PLAYER",
+    "TYPE_MASK",
+]
+
+
+def expected_events():
+    """Eventos do log de amostra como ficam depois de uma ida e volta em JSON."""
+    events = list(Parser().read_file(str(SAMPLE_LOG)))
+    return json.loads(json.dumps(events))
+
+
+def sample_cols(event, spell_name):
+    """
+    Colunas da primeira linha do log de amostra com o evento e a magia
+    informados, separadas como em Parser.parse_line.
+    """
+    lines = SAMPLE_LOG.read_text(encoding="utf-8").splitlines()
+    line = next(
+        line for line in lines if f" {event}," in line and f'"{spell_name}"' in line
+    )
+    return _split_csv(line.split(" ", 3)[3].strip())
+
+
+def local_timestamp(month, day, hour, minute, second, fraction):
+    """Timestamp esperado para uma data do log, que não traz o ano."""
+    year = datetime.date.today().year
+    return time.mktime((year, month, day, hour, minute, second, 0, 0, -1)) + fraction
+
+
+def convert_sample(monkeypatch, output_dir, ndjson, compress):
+    """
+    Converte o log de amostra com process_single_file no modo de saída pedido.
+
+    As opções de saída são lidas das variáveis de ambiente na importação do
+    módulo, por isso o teste substitui diretamente as globais correspondentes.
+    """
+    suffix = (".jsonl" if ndjson else ".json") + (".gz" if compress else "")
+    monkeypatch.setattr(convert_logs, "NDJSON", ndjson)
+    monkeypatch.setattr(convert_logs, "GZIP", compress)
+    monkeypatch.setattr(convert_logs, "OUTPUT_SUFFIX", suffix)
+    monkeypatch.setattr(convert_logs, "_PARSER", Parser())
+    monkeypatch.setattr(convert_logs, "_OUTPUT_DIR", output_dir)
+    convert_logs.process_single_file(SAMPLE_LOG)
+    return output_dir / f"{SAMPLE_LOG.stem}{suffix}"
+
+
+@pytest.mark.parametrize(
+    "ndjson, compress",
+    [(False, False), (True, False), (False, True), (True, True)],
+    ids=["json", "jsonl", "json.gz", "jsonl.gz"],
+)
+def test_output_modes_round_trip(monkeypatch, tmp_path, ndjson, compress):
+    """
+    Testa se cada modo de saída grava um arquivo que, lido de volta com os
+    módulos json e gzip, reproduz os eventos do parser.
+    """
+    output_file = convert_sample(monkeypatch, tmp_path, ndjson, compress)
+    if compress:
+        with gzip.open(output_file, "rt", encoding="utf-8") as f:
+            text = f.read()
+    else:
+        text = output_file.read_text(encoding="utf-8")
+
+    if ndjson:
+        data = [json.loads(line) for line in text.splitlines()]
+    else:
+        data = json.loads(text)
+
+    assert data == expected_events()
+
+
+def test_pretty_json_array_follows_patched_flag(monkeypatch, tmp_path):
+    """
+    Testa se write_json_array indenta todos os registros quando PRETTY é
+    alterado depois da importação do módulo.
+    """
+    monkeypatch.setattr(convert_logs, "PRETTY", True)
+    monkeypatch.setattr(convert_logs, "GZIP", False)
+    output_file = tmp_path / "pretty.json"
+    events = expected_events()
+    convert_logs.write_json_array(output_file, [events[:2], events[2:4]])
+
+    text = output_file.read_text(encoding="utf-8")
+    assert json.loads(text) == events[:4]
+    assert text.count('\n  "event": ') == 4
+
+
+def test_parse_spell_cast_success_full_record():
+    """
+    Testa se um SPELL_CAST_SUCCESS, resolvido pela tabela de prefixos e
+    sufixos, é montado com os parâmetros base e os dados da magia.
+    """
+    parser = Parser()
+    cols = sample_cols("SPELL_CAST_SUCCESS", "Throw Glaive")
+    ts = local_timestamp(11, 17, 21, 13, 55, 0.218)
+    obj = parser._parse_base_parameters(ts, cols[0], cols)
+
+    assert parser._handle_prefix_suffix_events(cols, obj) == {
+        "timestamp": ts,
+        "event": "SPELL_CAST_SUCCESS",
+        "sourceGUID": "Player-3684-0DEBA294",
+        "sourceName": "Rawdogger-Mal'Ganis",
+        "sourceFlags": HOSTILE_PLAYER_FLAGS,
+        "sourceRaidFlags": [],
+        "destGUID": "Player-1171-0A9765E1",
+        "destName": "Zuberion-WyrmrestAccord",
+        "destFlags": PARTY_PLAYER_FLAGS,
+        "destRaidFlags": ["AFFILIATION_PARTY", "AFFILIATION_MASK"],
+        "spellId": "185123",
+        "spellName": "Throw Glaive",
+        "spellSchool": ["Physical"],
+    }
+
+
+def test_verification_cache(tmp_path):
+    """
+    Testa o cache da verificação: a assinatura salva é reconhecida, deixa de
+    valer quando a entrada é alterada e um cache corrompido é ignorado.
+    """
+    test_input = tmp_path / "input.txt"
+    expected_output = tmp_path / "expected.json"
+    cache_path = tmp_path / convert_logs._VERIFY_CACHE_NAME
+    test_input.write_text("log", encoding="utf-8")
+    expected_output.write_text("[]", encoding="utf-8")
+
+    key = convert_logs._verification_key(test_input, expected_output)
+    assert key is not None
+    assert convert_logs._load_verified_key(cache_path) is None
+
+    convert_logs._save_verified_key(cache_path, key)
+    assert convert_logs._load_verified_key(cache_path) == key
+
+    stat = test_input.stat()
+    os.utime(test_input, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    new_key = convert_logs._verification_key(test_input, expected_output)
+    assert new_key != convert_logs._load_verified_key(cache_path)
+
+    cache_path.write_bytes(b"{corrompido")
+    assert convert_logs._load_verified_key(cache_path) is None
+
+
+@pytest.mark.parametrize(
+    "stamp",
+    [
+        "3/103 21:13:49.691",
+        "13/17 21:13:49.691",
+        "11/17 103:13:49.691",
+        "11/17 13:12:302.691",
+    ],
+    ids=["day", "month", "hour", "second"],
+)
+def test_parse_line_rejects_out_of_range_timestamp(stamp):
+    """
+    Testa se um timestamp com campo fora da faixa vira um registro de erro,
+    em vez de ser normalizado para outra data.
+    """
+    line = f"{stamp}  SPELL_CAST_SUCCESS,Player-1,\"A\",0x511,0x0"
+
+    record = Parser().parse_line(line)
+
+    assert record["event"].endswith("SPELL_CAST_SUCCESS")
+    assert "error" in record
+    assert record["raw_data"] == line
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [("()", []), ("(1,2)", [1, 2]), ("(1,)", [1]), ("1,,2", [1, 2])],
+)
+def test_to_ints_skips_empty_tokens(text, expected):
+    """
+    Testa se _to_ints ignora tokens vazios, como os deixados por uma vírgula
+    no fim da lista, em vez de falhar no COMBATANT_INFO.
+    """
+    assert convert_logs._to_ints(text) == expected
+
+
+def test_parse_line_match_type_does_not_split_fixed_fields():
+    """
+    Testa se os espaços de "Rated Solo Shuffle" não contam como separadores
+    das partes fixas: uma linha sem elas continua virando registro de erro.
+    """
+    line = "11/17 21:13:49.691 Rated Solo Shuffle,0"
+
+    record = Parser().parse_line(line)
+
+    assert record["error"].startswith("Formato inválido")
+    assert record["raw_data"] == "11/17 21:13:49.691 Rated_Solo_Shuffle,0"
+
+
+def test_process_files_skips_outputs_differing_in_case(monkeypatch, tmp_path):
+    """
+    Testa se process_files compara os nomes já convertidos com
+    os.path.normcase, que no Windows ignora maiúsculas e minúsculas.
+    """
+    monkeypatch.setattr(os.path, "normcase", str.lower)
+    monkeypatch.setattr(convert_logs, "OUTPUT_SUFFIX", ".json")
+    (tmp_path / "LOG.JSON").write_text("[]", encoding="utf-8")
+    log_file = tmp_path / "log.txt"
+    log_file.write_text(SAMPLE_LOG.read_text(encoding="utf-8"), encoding="utf-8")
+
+    convert_logs.process_files([log_file], tmp_path, max_workers=1)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["LOG.JSON", "log.txt"]